@@ -4,18 +4,101 @@ Climate Impact Predictor API
 FastAPI application that serves climate predictions from Metaflow flows.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from metaflow import Flow, namespace
+from contextlib import asynccontextmanager, suppress
+from datetime import date, datetime
+from bisect import bisect_left
+from decimal import Decimal
+import asyncio
+import difflib
+import hashlib
 import logging
+import os
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How often the background task reloads artifacts from the latest flow runs
+REFRESH_INTERVAL_SECONDS = int(os.environ.get("REFRESH_INTERVAL_SECONDS", 3600))
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _orjson_default(obj):
+    """Encode types orjson does not handle natively (e.g. pandas Timestamp)"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(content) -> bytes:
+    """Serialize content with numpy scalar/array support"""
+    return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+def _etag(body: bytes) -> str:
+    """Weak ETag for a pre-encoded body (gzip and identity forms share it)"""
+    return f'W/"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag"""
+    if if_none_match is None:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def _conditional_response(body: bytes, etag: str, if_none_match: str | None):
+    """Serve pre-encoded JSON, or 304 when the client already has this version"""
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+# Alert severity by probability: labels[i] applies above bounds[i - 1]
+_SEVERITY_BOUNDS = (0.25,)
+_SEVERITY_LABELS = ("medium", "high")
+
+# last_updated marker on payloads that are placeholders, not flow artifacts
+MOCK_DATA_MARKER = "mock-data"
+
+# Served by /alerts until refresh flow anomalies are loaded
+_EMPTY_ALERTS_BYTES = _dumps(
+    {"alerts": [], "count": 0, "last_updated": MOCK_DATA_MARKER}
+)
+
+# Constant liveness payload polled by load balancers
+_HEALTH_BYTES = _dumps({"status": "healthy", "service": "climate-api"})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load artifacts before serving, then keep them refreshed in the background"""
+    logger.info("Starting Climate API...")
+    await registry.load_latest_artifacts()
+    refresh_task = asyncio.create_task(_refresh_loop())
+    yield
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
+
+
 app = FastAPI(
     title="Climate Impact Predictor API",
     description="REST API for climate change impact predictions",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware for web UI
@@ -27,6 +110,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Only bodies over 512 B are compressed. Today's per-region predictions (~300 B)
+# and alerts (~220 B) fall below that; long alert lists or a growing region
+# list in /status are what this is for
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 
 class ModelRegistry:
     """Manages loaded models and predictions from Metaflow flows"""
@@ -37,83 +125,215 @@ class ModelRegistry:
         self.predictions = None
         self.anomalies = None
         self.last_updated = None
-
-    def load_latest_artifacts(self):
+        self.last_updated_str = None
+        self.encoded_predictions = {}
+        self.prediction_etags = {}
+        self.region_index = {}
+        self.region_list = []
+        self.encoded_alerts = _EMPTY_ALERTS_BYTES
+        self.alerts_etag = _etag(_EMPTY_ALERTS_BYTES)
+        self.encoded_status = self._encode_status()
+
+    async def load_latest_artifacts(self):
         """Load artifacts from latest successful flow runs"""
-        try:
-            namespace(None)
+        namespace(None)
+
+        # The two flows are independent, so fetch them concurrently
+        logger.info("Loading ClimateTrainingFlow and ClimateDataRefreshFlow...")
+        training, refresh = await asyncio.gather(
+            asyncio.to_thread(_fetch_training_artifacts),
+            asyncio.to_thread(_fetch_refresh_artifacts),
+            return_exceptions=True,
+        )
 
-            # Load training flow artifacts
-            logger.info("Loading ClimateTrainingFlow...")
-            training_flow = Flow("ClimateTrainingFlow")
-            training_run = training_flow.latest_successful_run
+        if isinstance(training, Exception):
+            logger.warning(f"Could not load training artifacts: {training}")
+        elif training:
+            self.models = training["models"]
+            self.metrics = training["metrics"]
+            logger.info(f"✓ Loaded models from run {training['run_id']}")
 
-            if training_run:
-                self.models = training_run.data.models
-                self.metrics = training_run.data.metrics
-                logger.info(f"✓ Loaded models from run {training_run.id}")
+        if isinstance(refresh, Exception):
+            logger.warning(f"Could not load refresh artifacts: {refresh}")
+            logger.info("Running in mock data mode")
+        elif refresh:
+            try:
+                self._apply_refresh_artifacts(refresh)
+            except Exception as e:
+                logger.warning(f"Could not apply refresh artifacts: {e}")
+            else:
+                logger.info(f"✓ Loaded predictions from run {refresh['run_id']}")
+
+        self.encoded_status = self._encode_status()
+
+    def _apply_refresh_artifacts(self, refresh):
+        """Encode refresh artifacts, then swap them in only if all of it succeeds"""
+        predictions = refresh["predictions"]
+        anomalies = refresh["anomalies"]
+        last_updated = refresh["last_updated"]
+        last_updated_str = str(last_updated) if last_updated else None
+
+        encoded_predictions = _encode_predictions(predictions, last_updated_str)
+        prediction_etags = {
+            name: _etag(body) for name, body in encoded_predictions.items()
+        }
+        region_index = {name.lower(): name for name in predictions}
+        region_list = list(predictions.keys())
+        encoded_alerts = _encode_alerts(anomalies, last_updated_str)
+        alerts_etag = _etag(encoded_alerts)
+
+        # Nothing below can raise, so readers never see a half-updated registry
+        self.predictions = predictions
+        self.anomalies = anomalies
+        self.last_updated = last_updated
+        self.last_updated_str = last_updated_str
+        self.encoded_predictions = encoded_predictions
+        self.prediction_etags = prediction_etags
+        self.region_index = region_index
+        self.region_list = region_list
+        self.encoded_alerts = encoded_alerts
+        self.alerts_etag = alerts_etag
+
+    def _encode_status(self):
+        """Pre-serialize the /status response body"""
+        return _dumps(
+            {
+                "status": "running",
+                "models_loaded": self.models is not None,
+                "predictions_loaded": self.predictions is not None,
+                "last_updated": self.last_updated_str,
+                "available_regions": self.region_list,
+            }
+        )
 
-            # Load refresh flow artifacts
-            logger.info("Loading ClimateDataRefreshFlow...")
-            refresh_flow = Flow("ClimateDataRefreshFlow")
-            refresh_run = refresh_flow.latest_successful_run
 
-            if refresh_run:
-                self.predictions = refresh_run.data.all_predictions
-                self.anomalies = refresh_run.data.all_anomalies
-                self.last_updated = refresh_run.data.fetch_timestamp
-                logger.info(f"✓ Loaded predictions from run {refresh_run.id}")
+def _encode_predictions(predictions: dict, last_updated_str: str | None):
+    """Pre-serialize the /predictions response body for each region"""
+    last_updated = last_updated_str or "unknown"
+    return {
+        region_name: _dumps(_build_region_payload(region_name, pred_data, last_updated))
+        for region_name, pred_data in predictions.items()
+    }
 
-        except Exception as e:
-            logger.warning(f"Could not load artifacts: {e}")
-            logger.info("Running in mock data mode")
 
+def _encode_alerts(anomalies: list | None, last_updated_str: str | None):
+    """Pre-serialize the /alerts response body"""
+    if anomalies is None:
+        return _EMPTY_ALERTS_BYTES
 
-registry = ModelRegistry()
+    alerts = []
+    for anomaly in anomalies:
+        probability = anomaly["probability"]
+        alerts.append(
+            {
+                "type": anomaly["type"],
+                "region": anomaly["region"],
+                "probability": probability,
+                "severity": _SEVERITY_LABELS[
+                    bisect_left(_SEVERITY_BOUNDS, probability)
+                ],
+            }
+        )
+    return _dumps(
+        {
+            "alerts": alerts,
+            "count": len(alerts),
+            "last_updated": last_updated_str,
+        }
+    )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Load artifacts on startup"""
-    logger.info("Starting Climate API...")
-    registry.load_latest_artifacts()
+def _build_region_payload(region_name: str, pred_data: dict, last_updated: str):
+    """Build the /predictions response body for a region"""
+    return {
+        "region_name": region_name,
+        "predicted_temp_change": pred_data["temperature"],
+        "predicted_precip_change": pred_data["precipitation"],
+        "extreme_event_probabilities": pred_data["extreme_events"],
+        "last_updated": last_updated,
+    }
 
 
-@app.get("/")
-def root():
-    """API root endpoint"""
+def _fetch_training_artifacts():
+    """Fetch models and metrics from the latest ClimateTrainingFlow run"""
+    training_run = Flow("ClimateTrainingFlow").latest_successful_run
+    if not training_run:
+        return None
+    return {
+        "run_id": training_run.id,
+        "models": training_run.data.models,
+        "metrics": training_run.data.metrics,
+    }
+
+
+def _fetch_refresh_artifacts():
+    """Fetch predictions and anomalies from the latest ClimateDataRefreshFlow run"""
+    refresh_run = Flow("ClimateDataRefreshFlow").latest_successful_run
+    if not refresh_run:
+        return None
     return {
+        "run_id": refresh_run.id,
+        "predictions": refresh_run.data.all_predictions,
+        "anomalies": refresh_run.data.all_anomalies,
+        "last_updated": refresh_run.data.fetch_timestamp,
+    }
+
+
+registry = ModelRegistry()
+
+
+async def _refresh_loop():
+    """Reload artifacts every REFRESH_INTERVAL_SECONDS after the startup load"""
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+        try:
+            await registry.load_latest_artifacts()
+        except Exception as e:
+            logger.warning(f"Artifact refresh failed: {e}")
+
+
+_ROOT_BYTES = _dumps(
+    {
         "message": "Climate Impact Predictor API v1.0",
         "documentation": "/docs",
         "endpoints": {
             "predictions": "/predictions/{region_name}",
             "alerts": "/alerts",
             "status": "/status",
+            "health": "/health",
         },
     }
+)
+
+
+@app.get("/")
+async def root():
+    """API root endpoint"""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/status")
-def get_status():
+async def get_status():
     """Get API status and loaded data information"""
-    return {
-        "status": "running",
-        "models_loaded": registry.models is not None,
-        "predictions_loaded": registry.predictions is not None,
-        "last_updated": str(registry.last_updated) if registry.last_updated else None,
-        "available_regions": (
-            list(registry.predictions.keys()) if registry.predictions else []
-        ),
-    }
+    return Response(content=registry.encoded_status, media_type="application/json")
+
+
+@app.get("/health")
+async def health_check():
+    """Liveness check for load balancers"""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/predictions/{region_name}")
-def get_region_predictions(region_name: str):
+async def get_region_predictions(
+    region_name: str, if_none_match: str | None = Header(default=None)
+):
     """
     Get climate predictions for a specific region
 
     Args:
         region_name: Name of the region (e.g., "Austin, TX")
+        if_none_match: ETag from a previous response; a match returns 304
 
     Returns:
         Predictions including temperature, precipitation, and extreme events
@@ -121,32 +341,32 @@ def get_region_predictions(region_name: str):
     # Check if predictions are loaded
     if registry.predictions is None:
         logger.warning("No predictions loaded, returning mock data")
-        return _get_mock_predictions(region_name)
-
-    # Look up region
-    if region_name not in registry.predictions:
-        # Try case-insensitive match
-        available_regions = list(registry.predictions.keys())
-        region_lower = region_name.lower()
-        for available in available_regions:
-            if available.lower() == region_lower:
-                region_name = available
-                break
-        else:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Region '{region_name}' not found. Available: {available_regions}",
-            )
+        return Response(
+            content=_dumps(_get_mock_predictions(region_name)),
+            media_type="application/json",
+        )
 
-    pred_data = registry.predictions[region_name]
+    # Look up region (case-insensitive)
+    canonical_name = registry.region_index.get(region_name.lower())
+    if canonical_name is None:
+        # Suggest a bounded set of near matches rather than echoing every region,
+        # compared in lowercase like the lookup itself
+        suggestions = [
+            registry.region_index[match]
+            for match in difflib.get_close_matches(
+                region_name.lower(), registry.region_index, n=20, cutoff=0.6
+            )
+        ]
+        raise HTTPException(
+            status_code=404,
+            detail=f"Region '{region_name}' not found. Did you mean: {suggestions}",
+        )
 
-    return {
-        "region_name": region_name,
-        "predicted_temp_change": pred_data["temperature"],
-        "predicted_precip_change": pred_data["precipitation"],
-        "extreme_event_probabilities": pred_data["extreme_events"],
-        "last_updated": str(registry.last_updated) if registry.last_updated else "unknown",
-    }
+    return _conditional_response(
+        registry.encoded_predictions[canonical_name],
+        registry.prediction_etags[canonical_name],
+        if_none_match,
+    )
 
 
 def _get_mock_predictions(region_name: str):
@@ -161,38 +381,21 @@ def _get_mock_predictions(region_name: str):
             "flood": 0.08,
             "cold_snap": 0.05,
         },
-        "last_updated": "mock-data",
+        "last_updated": MOCK_DATA_MARKER,
     }
 
 
 @app.get("/alerts")
-def get_active_alerts():
+async def get_active_alerts(if_none_match: str | None = Header(default=None)):
     """
     Get current climate anomaly alerts
 
     Returns:
         List of active alerts with severity and probability
     """
-    if registry.anomalies is None:
-        return {"alerts": [], "count": 0}
-
-    alerts = []
-    for anomaly in registry.anomalies:
-        severity = "high" if anomaly["probability"] > 0.25 else "medium"
-        alerts.append(
-            {
-                "type": anomaly["type"],
-                "region": anomaly["region"],
-                "probability": anomaly["probability"],
-                "severity": severity,
-            }
-        )
-
-    return {
-        "alerts": alerts,
-        "count": len(alerts),
-        "last_updated": str(registry.last_updated) if registry.last_updated else None,
-    }
+    return _conditional_response(
+        registry.encoded_alerts, registry.alerts_etag, if_none_match
+    )
 
 
 if __name__ == "__main__":
@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """
 Entry point for Outerbounds deployment.
-This imports the FastAPI app and keeps the process alive.
+This serves the FastAPI app with uvicorn in-process.
 """
-import time
+import os
+
+import uvicorn
 
 if __name__ == "__main__":
-    print("Climate API loaded successfully")
-    print("App available at app:app")
-    # Keep process alive
-    while True:
-        time.sleep(3600)
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        loop="uvloop",
+        http="httptools",
+    )
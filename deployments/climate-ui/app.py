@@ -5,8 +5,9 @@ Streamlit app to visualize climate predictions from the ClimateAPI.
 """
 
 import streamlit as st
-import requests
-import pandas as pd
+import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure page
 st.set_page_config(
@@ -17,6 +18,97 @@ st.set_page_config(
 
 # API configuration
 API_URL = "http://climate-api:8000"  # Internal service name in Outerbounds
+DEFAULT_REGIONS = ["Austin, TX", "Miami, FL", "Phoenix, AZ", "Seattle, WA"]
+MOCK_DATA_MARKER = "mock-data"  # API's last_updated before artifacts load
+
+
+class UncachedResponse(Exception):
+    """Raised by a cached fetcher so a placeholder payload is shown but not cached"""
+
+    def __init__(self, data):
+        super().__init__("API artifacts are not loaded yet")
+        self.data = data
+
+
+def result_or_placeholder(future):
+    """Return a fetcher's result, falling back to its uncached placeholder"""
+    try:
+        return future.result()
+    except UncachedResponse as e:
+        return e.data
+
+
+@st.cache_resource
+def get_http(api_url: str) -> httpx.Client:
+    # Pooled keep-alive client that survives script reruns and is shared by users
+    return httpx.Client(
+        base_url=api_url,
+        timeout=5.0,
+        transport=httpx.HTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        ),
+    )
+
+
+@st.cache_resource
+def get_etag_store() -> dict:
+    # path -> (ETag, decoded body) of the last full response, shared by users
+    return {}
+
+
+def fetch_json(http: httpx.Client, store: dict, path: str):
+    """GET an API path, revalidating the last response with If-None-Match"""
+    cached = store.get(path)
+    headers = {"If-None-Match": cached[0]} if cached else {}
+
+    response = http.get(path, headers=headers)
+    if cached and response.status_code == 304:
+        return cached[1]
+    response.raise_for_status()
+
+    data = orjson.loads(response.content)
+    if data.get("last_updated") == MOCK_DATA_MARKER:
+        raise UncachedResponse(data)
+    etag = response.headers.get("ETag")
+    if etag:
+        store[path] = (etag, data)
+    return data
+
+
+# Cached API fetchers: identical requests within the TTL are served from
+# Streamlit's shared in-process cache. Failures raise and are not cached.
+# Leading underscores keep the client and ETag store out of the cache key.
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_regions(_http: httpx.Client, api_url: str) -> list[str]:
+    # Regions change rarely, so keep them out of the per-rerun fetches
+    response = _http.get("/status")
+    response.raise_for_status()
+    regions = orjson.loads(response.content).get("available_regions")
+    if not regions:
+        # API has no artifacts yet; show defaults without caching them
+        raise UncachedResponse(DEFAULT_REGIONS)
+    return regions
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_predictions(_http: httpx.Client, _store: dict, region: str):
+    return fetch_json(_http, _store, f"/predictions/{region}")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def get_alerts(_http: httpx.Client, _store: dict):
+    return fetch_json(_http, _store, "/alerts")
+
+
+# Resolve shared resources here: st.cache_resource needs the script thread
+http = get_http(API_URL)
+etag_store = get_etag_store()
+
+# Fan out independent API calls instead of paying one round-trip each
+executor = ThreadPoolExecutor(max_workers=3)
+regions_future = executor.submit(load_regions, http, API_URL)
+alerts_future = executor.submit(get_alerts, http, etag_store)
 
 # Title and description
 st.title("🌍 Climate Change Impact Predictor")
@@ -27,26 +119,30 @@ st.sidebar.header("Settings")
 
 # Get available regions from API
 try:
-    status_response = requests.get(f"{API_URL}/status", timeout=5)
-    if status_response.ok:
-        status_data = status_response.json()
-        regions = status_data.get("available_regions", [
-            "Austin, TX", "Miami, FL", "Phoenix, AZ", "Seattle, WA"
-        ])
-        api_status = "✅ Connected"
-    else:
-        regions = ["Austin, TX", "Miami, FL", "Phoenix, AZ", "Seattle, WA"]
-        api_status = "⚠️ Using defaults"
+    regions = regions_future.result()
+    api_status = "✅ Connected"
+except UncachedResponse as e:
+    regions = e.data
+    api_status = "⚠️ Using defaults"
+except httpx.HTTPStatusError:
+    regions = DEFAULT_REGIONS
+    api_status = "⚠️ Using defaults"
 except Exception as e:
-    regions = ["Austin, TX", "Miami, FL", "Phoenix, AZ", "Seattle, WA"]
+    regions = DEFAULT_REGIONS
     api_status = f"❌ Error: {str(e)}"
 
 st.sidebar.metric("API Status", api_status)
 
 selected_region = st.sidebar.selectbox("Select Region", regions)
 
-# Refresh button
+pred_future = executor.submit(get_predictions, http, etag_store, selected_region)
+executor.shutdown(wait=False)
+
+# Refresh button bypasses the response cache
 if st.sidebar.button("🔄 Refresh Data"):
+    load_regions.clear()
+    get_predictions.clear()
+    get_alerts.clear()
     st.rerun()
 
 # Main content area
@@ -54,74 +150,68 @@ col1, col2 = st.columns(2)
 
 # Fetch predictions for selected region
 try:
-    pred_response = requests.get(
-        f"{API_URL}/predictions/{selected_region}",
-        timeout=5
-    )
+    pred_data = result_or_placeholder(pred_future)
+
+    # Temperature predictions
+    with col1:
+        st.subheader("🌡️ Temperature Change")
+        temp_change = pred_data.get("predicted_temp_change", {})
+
+        temp_data = {
+            "Horizon": ["1 Year", "5 Years", "10 Years"],
+            "Temperature Change (°C)": [
+                temp_change.get("1_year", 0),
+                temp_change.get("5_year", 0),
+                temp_change.get("10_year", 0),
+            ]
+        }
 
-    if pred_response.ok:
-        pred_data = pred_response.json()
-
-        # Temperature predictions
-        with col1:
-            st.subheader("🌡️ Temperature Change")
-            temp_change = pred_data.get("predicted_temp_change", {})
-
-            temp_df = pd.DataFrame({
-                "Horizon": ["1 Year", "5 Years", "10 Years"],
-                "Temperature Change (°C)": [
-                    temp_change.get("1_year", 0),
-                    temp_change.get("5_year", 0),
-                    temp_change.get("10_year", 0),
-                ]
-            })
-
-            st.line_chart(temp_df.set_index("Horizon"))
-
-            # Show values in table
-            st.dataframe(temp_df, use_container_width=True)
-
-        # Precipitation predictions
-        with col2:
-            st.subheader("💧 Precipitation Change")
-            precip_change = pred_data.get("predicted_precip_change", {})
-
-            precip_df = pd.DataFrame({
-                "Horizon": ["1 Year", "5 Years", "10 Years"],
-                "Precipitation Change (mm)": [
-                    precip_change.get("1_year", 0),
-                    precip_change.get("5_year", 0),
-                    precip_change.get("10_year", 0),
-                ]
-            })
-
-            st.line_chart(precip_df.set_index("Horizon"))
-
-            # Show values in table
-            st.dataframe(precip_df, use_container_width=True)
-
-        # Extreme events
-        st.subheader("⚠️ Extreme Event Probabilities")
-        extreme_events = pred_data.get("extreme_event_probabilities", {})
-
-        event_df = pd.DataFrame({
-            "Event Type": ["Heatwave", "Drought", "Flood", "Cold Snap"],
-            "Probability": [
-                extreme_events.get("heatwave", 0),
-                extreme_events.get("drought", 0),
-                extreme_events.get("flood", 0),
-                extreme_events.get("cold_snap", 0),
+        st.line_chart(temp_data, x="Horizon")
+
+        # Show values in table
+        st.dataframe(temp_data, use_container_width=True)
+
+    # Precipitation predictions
+    with col2:
+        st.subheader("💧 Precipitation Change")
+        precip_change = pred_data.get("predicted_precip_change", {})
+
+        precip_data = {
+            "Horizon": ["1 Year", "5 Years", "10 Years"],
+            "Precipitation Change (mm)": [
+                precip_change.get("1_year", 0),
+                precip_change.get("5_year", 0),
+                precip_change.get("10_year", 0),
             ]
-        })
+        }
 
-        st.bar_chart(event_df.set_index("Event Type"))
+        st.line_chart(precip_data, x="Horizon")
 
-        # Last updated
-        last_updated = pred_data.get("last_updated", "Unknown")
-        st.info(f"📅 Last updated: {last_updated}")
+        # Show values in table
+        st.dataframe(precip_data, use_container_width=True)
 
-    else:
-        st.error(f"Failed to fetch predictions: {pred_response.status_code}")
+    # Extreme events
+    st.subheader("⚠️ Extreme Event Probabilities")
+    extreme_events = pred_data.get("extreme_event_probabilities", {})
+
+    event_data = {
+        "Event Type": ["Heatwave", "Drought", "Flood", "Cold Snap"],
+        "Probability": [
+            extreme_events.get("heatwave", 0),
+            extreme_events.get("drought", 0),
+            extreme_events.get("flood", 0),
+            extreme_events.get("cold_snap", 0),
+        ]
+    }
+
+    st.bar_chart(event_data, x="Event Type")
+
+    # Last updated
+    last_updated = pred_data.get("last_updated", "Unknown")
+    st.info(f"📅 Last updated: {last_updated}")
+
+except httpx.HTTPStatusError as e:
+    st.error(f"Failed to fetch predictions: {e.response.status_code}")
 
 except Exception as e:
     st.error(f"Error connecting to API: {str(e)}")
@@ -132,23 +222,21 @@ st.divider()
 st.subheader("🚨 Active Climate Alerts")
 
 try:
-    alerts_response = requests.get(f"{API_URL}/alerts", timeout=5)
-
-    if alerts_response.ok:
-        alerts_data = alerts_response.json()
-        alerts = alerts_data.get("alerts", [])
-
-        if alerts:
-            for alert in alerts:
-                severity_color = "🔴" if alert["severity"] == "high" else "🟡"
-                st.warning(
-                    f"{severity_color} **{alert['type'].upper()}** in {alert['region']} "
-                    f"- {alert['probability']:.1%} probability"
-                )
-        else:
-            st.success("✅ No active climate alerts")
+    alerts_data = result_or_placeholder(alerts_future)
+    alerts = alerts_data.get("alerts", [])
+
+    if alerts:
+        for alert in alerts:
+            severity_color = "🔴" if alert["severity"] == "high" else "🟡"
+            st.warning(
+                f"{severity_color} **{alert['type'].upper()}** in {alert['region']} "
+                f"- {alert['probability']:.1%} probability"
+            )
     else:
-        st.warning("Could not fetch alerts")
+        st.success("✅ No active climate alerts")
+
+except httpx.HTTPStatusError:
+    st.warning("Could not fetch alerts")
 
 except Exception as e:
     st.warning(f"Could not fetch alerts: {str(e)}")
@@ -7,6 +7,55 @@ Scheduled flow that fetches latest climate observations and generates prediction
 from metaflow import step
 from obproject import ProjectFlow
 from datetime import datetime
+import numpy as np
+
+# The 4 regions to monitor, as (name, lat, lon)
+REGIONS = (
+    ("Austin, TX", 30.2672, -97.7431),
+    ("Miami, FL", 25.7617, -80.1918),
+    ("Phoenix, AZ", 33.4484, -112.0740),
+    ("Seattle, WA", 47.6062, -122.3321),
+)
+
+# Column layout of a region's prediction vector: (group, key) per column
+PREDICTION_FIELDS = (
+    ("temperature", "1_year"),
+    ("temperature", "5_year"),
+    ("temperature", "10_year"),
+    ("precipitation", "1_year"),
+    ("precipitation", "5_year"),
+    ("precipitation", "10_year"),
+    ("extreme_events", "heatwave"),
+    ("extreme_events", "drought"),
+    ("extreme_events", "flood"),
+    ("extreme_events", "cold_snap"),
+)
+
+# Extreme-event probabilities above these thresholds are flagged as anomalies
+ANOMALY_THRESHOLDS = {"heatwave": 0.20}
+
+
+def _unpack_predictions(pred_vec):
+    """Rebuild the nested predictions dict served by the API from a vector"""
+    predictions = {}
+    for (group, key), value in zip(PREDICTION_FIELDS, pred_vec):
+        predictions.setdefault(group, {})[key] = float(value)
+    return predictions
+
+
+def _detect_anomalies(region_names, prediction_matrix):
+    """Flag high-risk events across all regions in one pass per event"""
+    region_names = np.array(region_names)
+    anomalies = []
+    for event, threshold in ANOMALY_THRESHOLDS.items():
+        column = PREDICTION_FIELDS.index(("extreme_events", event))
+        probabilities = prediction_matrix[:, column]
+        mask = probabilities > threshold
+        anomalies.extend(
+            {"type": event, "probability": float(p), "region": str(r)}
+            for p, r in zip(probabilities[mask], region_names[mask])
+        )
+    return anomalies
 
 
 class ClimateDataRefreshFlow(ProjectFlow):
@@ -20,21 +69,15 @@ class ClimateDataRefreshFlow(ProjectFlow):
         self.fetch_timestamp = datetime.now()
         print(f"Data refresh triggered at {self.fetch_timestamp}")
 
-        # Define the 4 regions to monitor
-        self.regions = [
-            {"name": "Austin, TX", "lat": 30.2672, "lon": -97.7431},
-            {"name": "Miami, FL", "lat": 25.7617, "lon": -80.1918},
-            {"name": "Phoenix, AZ", "lat": 33.4484, "lon": -112.0740},
-            {"name": "Seattle, WA", "lat": 47.6062, "lon": -122.3321},
-        ]
+        self.regions = list(REGIONS)
 
         self.next(self.fetch_and_predict, foreach="regions")
 
     @step
     def fetch_and_predict(self):
         """Fetch data and generate predictions for each region"""
-        region = self.input
-        print(f"Processing {region['name']}...")
+        region_name, lat, lon = self.input
+        print(f"Processing {region_name}...")
 
         # TODO: Fetch actual weather data from APIs
         self.current_weather = {
@@ -44,7 +87,7 @@ class ClimateDataRefreshFlow(ProjectFlow):
         }
 
         # TODO: Load trained models and run inference
-        self.predictions = {
+        predictions = {
             "temperature": {"1_year": 26.2, "5_year": 27.8, "10_year": 29.1},
             "precipitation": {"1_year": 850, "5_year": 820, "10_year": 790},
             "extreme_events": {
@@ -55,16 +98,12 @@ class ClimateDataRefreshFlow(ProjectFlow):
             },
         }
 
-        # Detect high-risk anomalies
-        self.anomalies = []
-        if self.predictions["extreme_events"]["heatwave"] > 0.20:
-            self.anomalies.append(
-                {
-                    "type": "heatwave",
-                    "probability": self.predictions["extreme_events"]["heatwave"],
-                    "region": region["name"],
-                }
-            )
+        # Persist one flat vector per branch instead of a nested dict
+        self.region_name = region_name
+        self.pred_vec = np.array(
+            [predictions[group][key] for group, key in PREDICTION_FIELDS],
+            dtype=np.float64,
+        )
 
         self.next(self.join)
 
@@ -73,21 +112,28 @@ class ClimateDataRefreshFlow(ProjectFlow):
         """Aggregate predictions from all regions"""
         print("Aggregating predictions from all regions...")
 
-        # Convert inputs to list to get length
-        inputs_list = list(inputs)
+        region_names = []
+        rows = []
 
-        self.fetch_timestamp = inputs_list[0].fetch_timestamp
-        self.all_predictions = {}
-        self.all_anomalies = []
+        # Single pass over the branches; avoid materializing every input at once
+        for input_data in inputs:
+            if not rows:
+                self.fetch_timestamp = input_data.fetch_timestamp
 
-        for input_data in inputs_list:
-            region_name = input_data.input["name"]
-            self.all_predictions[region_name] = input_data.predictions
+            region_names.append(input_data.region_name)
+            rows.append(input_data.pred_vec)
 
-            if input_data.anomalies:
-                self.all_anomalies.extend(input_data.anomalies)
+        # (regions x PREDICTION_FIELDS) working matrix, kept local so the join
+        # persists only all_predictions, the shape the API reads
+        prediction_matrix = np.vstack(rows)
+        self.all_predictions = {
+            region_name: _unpack_predictions(row)
+            for region_name, row in zip(region_names, prediction_matrix)
+        }
+
+        self.all_anomalies = _detect_anomalies(region_names, prediction_matrix)
 
-        print(f"Processed {len(inputs_list)} regions")
+        print(f"Processed {len(region_names)} regions")
         print(f"Detected {len(self.all_anomalies)} anomalies")
 
         self.next(self.end)
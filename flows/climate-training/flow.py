@@ -6,6 +6,7 @@ This flow trains ML models to predict climate impacts based on historical patter
 
 from metaflow import step, Parameter
 from obproject import ProjectFlow
+import numpy as np
 
 
 class ClimateTrainingFlow(ProjectFlow):
@@ -36,10 +37,13 @@ class ClimateTrainingFlow(ProjectFlow):
         print("Loading historical climate data...")
 
         # TODO: Implement actual data loading from NOAA, MODIS, ERA5
-        # For now, create placeholder structure
+        # For now, create placeholder structure. Hourly series are float32
+        # columns aligned on `timestamps`; loaders should preallocate them
+        # (np.empty(n_hours, dtype=np.float32)) rather than append to lists.
         self.historical_data = {
-            "temperature": [],
-            "precipitation": [],
+            "timestamps": np.empty(0, dtype="datetime64[h]"),
+            "temperature": np.empty(0, dtype=np.float32),
+            "precipitation": np.empty(0, dtype=np.float32),
             "extreme_events": [],
         }
 
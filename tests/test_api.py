@@ -0,0 +1,141 @@
+"""
+Tests for the Climate API
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+APP_PATH = Path(__file__).parent.parent / "deployments" / "climate-api" / "app.py"
+
+spec = importlib.util.spec_from_file_location("climate_api_app", APP_PATH)
+climate_api = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(climate_api)
+
+
+def _region_predictions(heatwave):
+    return {
+        "temperature": {"1_year": 26.2, "5_year": 27.8, "10_year": 29.1},
+        "precipitation": {"1_year": 850, "5_year": 820, "10_year": 790},
+        "extreme_events": {
+            "heatwave": heatwave,
+            "drought": 0.12,
+            "flood": 0.08,
+            "cold_snap": 0.05,
+        },
+    }
+
+
+REFRESH_ARTIFACTS = {
+    "run_id": "42",
+    "predictions": {
+        "Austin, TX": _region_predictions(0.25),
+        "Phoenix, AZ": _region_predictions(0.30),
+    },
+    "anomalies": [
+        {"type": "heatwave", "probability": 0.25, "region": "Austin, TX"},
+        {"type": "heatwave", "probability": 0.30, "region": "Phoenix, AZ"},
+    ],
+    "last_updated": "2024-01-01 00:00:00",
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """API client with flow artifacts served from REFRESH_ARTIFACTS"""
+    monkeypatch.setattr(climate_api, "registry", climate_api.ModelRegistry())
+    monkeypatch.setattr(climate_api, "_fetch_training_artifacts", lambda: None)
+    monkeypatch.setattr(
+        climate_api, "_fetch_refresh_artifacts", lambda: REFRESH_ARTIFACTS
+    )
+    with TestClient(climate_api.app) as test_client:
+        yield test_client
+
+
+def test_predictions_case_insensitive(client):
+    """Region lookup ignores case and returns the canonical name"""
+    response = client.get("/predictions/austin, tx")
+    assert response.status_code == 200
+    assert response.json()["region_name"] == "Austin, TX"
+
+
+def test_alert_severity_boundary(client):
+    """Probability of exactly 0.25 is medium; anything above is high"""
+    alerts = client.get("/alerts").json()["alerts"]
+    severities = {alert["region"]: alert["severity"] for alert in alerts}
+    assert severities == {"Austin, TX": "medium", "Phoenix, AZ": "high"}
+
+
+def test_health(client):
+    """Health check returns the constant liveness payload"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "service": "climate-api"}
+
+
+def test_status_lists_loaded_regions(client):
+    """Status reflects the artifacts loaded at startup"""
+    status = client.get("/status").json()
+    assert status["predictions_loaded"] is True
+    assert status["available_regions"] == ["Austin, TX", "Phoenix, AZ"]
+
+
+def test_unknown_region_suggests_close_matches(client):
+    """404 detail lists near matches only, not every region"""
+    response = client.get("/predictions/Austin, TXX")
+    assert response.status_code == 404
+    detail = response.json()["detail"]
+    assert "Austin, TX" in detail
+    assert "Phoenix, AZ" not in detail
+
+
+@pytest.mark.parametrize(
+    "region_name, expected", [("austin", "Austin, TX"), ("PHOENIX AZ", "Phoenix, AZ")]
+)
+def test_close_matches_ignore_case(client, region_name, expected):
+    """Suggestions are matched in lowercase and reported by canonical name"""
+    detail = client.get(f"/predictions/{region_name}").json()["detail"]
+    assert detail.endswith(f"Did you mean: {[expected]}")
+
+
+@pytest.mark.parametrize("path", ["/predictions/Austin, TX", "/alerts"])
+def test_if_none_match_returns_304(client, path):
+    """Matching weak, listed or wildcard validators revalidate with 304"""
+    first = client.get(path)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    for if_none_match in (etag, etag.removeprefix("W/"), f'W/"other", {etag}', "*"):
+        response = client.get(path, headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+    response = client.get(path, headers={"If-None-Match": 'W/"other"'})
+    assert response.status_code == 200
+    assert response.content == first.content
+
+
+def test_failed_refresh_keeps_previous_state(client, monkeypatch):
+    """A refresh that fails to encode leaves the last good artifacts in place"""
+    broken = {**REFRESH_ARTIFACTS, "predictions": {"Miami, FL": {}}}
+    monkeypatch.setattr(climate_api, "_fetch_refresh_artifacts", lambda: broken)
+    client.portal.call(climate_api.registry.load_latest_artifacts)
+
+    response = client.get("/predictions/Phoenix, AZ")
+    assert response.status_code == 200
+    assert client.get("/predictions/Miami, FL").status_code == 404
+
+
+def test_mock_predictions_before_artifacts_load(monkeypatch):
+    """Without refresh artifacts, predictions fall back to the mock payload"""
+    monkeypatch.setattr(climate_api, "registry", climate_api.ModelRegistry())
+    monkeypatch.setattr(climate_api, "_fetch_training_artifacts", lambda: None)
+    monkeypatch.setattr(climate_api, "_fetch_refresh_artifacts", lambda: None)
+    with TestClient(climate_api.app) as test_client:
+        response = test_client.get("/predictions/Austin, TX")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["last_updated"] == climate_api.MOCK_DATA_MARKER
@@ -0,0 +1,64 @@
+"""
+Tests for the climate data refresh flow
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+FLOW_PATH = Path(__file__).parent.parent / "flows" / "climate-refresh" / "flow.py"
+
+
+@pytest.fixture(scope="module")
+def refresh_flow():
+    """Flow module loaded by path, with the Outerbounds obproject package stubbed"""
+    obproject = types.ModuleType("obproject")
+    obproject.ProjectFlow = type("ProjectFlow", (), {})
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(sys.modules, "obproject", obproject)
+        spec = importlib.util.spec_from_file_location("climate_refresh_flow", FLOW_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def test_unpack_predictions_rebuilds_nested_floats(refresh_flow):
+    """A prediction vector unpacks to the nested dict the API serves"""
+    predictions = refresh_flow._unpack_predictions(
+        [26.2, 27.8, 29.1, 850, 820, 790, 0.15, 0.12, 0.08, 0.05]
+    )
+    assert predictions == {
+        "temperature": {"1_year": 26.2, "5_year": 27.8, "10_year": 29.1},
+        "precipitation": {"1_year": 850.0, "5_year": 820.0, "10_year": 790.0},
+        "extreme_events": {
+            "heatwave": 0.15,
+            "drought": 0.12,
+            "flood": 0.08,
+            "cold_snap": 0.05,
+        },
+    }
+    assert all(
+        type(value) is float
+        for group in predictions.values()
+        for value in group.values()
+    )
+
+
+def test_detect_anomalies_flags_regions_above_threshold(refresh_flow):
+    """Only heatwave probabilities strictly above 0.20 become anomalies"""
+    heatwave = refresh_flow.PREDICTION_FIELDS.index(("extreme_events", "heatwave"))
+    prediction_matrix = np.zeros((3, len(refresh_flow.PREDICTION_FIELDS)))
+    prediction_matrix[:, heatwave] = [0.15, 0.20, 0.35]
+
+    anomalies = refresh_flow._detect_anomalies(
+        ["Austin, TX", "Miami, FL", "Phoenix, AZ"], prediction_matrix
+    )
+    assert anomalies == [
+        {"type": "heatwave", "probability": 0.35, "region": "Phoenix, AZ"}
+    ]
+    assert type(anomalies[0]["probability"]) is float
+    assert type(anomalies[0]["region"]) is str